@@ -31,6 +31,10 @@ CORS(app)
 
 db = SQLAlchemy(app)
 
+# External API base URLs (overridable so load tests can point at local stand-ins)
+GEMINI_API_URL = os.getenv("GEMINI_API_URL", "https://generativelanguage.googleapis.com")
+ELEVENLABS_API_URL = os.getenv("ELEVENLABS_API_URL", "https://api.elevenlabs.io")
+
 @app.route("/")
 def index():
     return jsonify({"message": "Flask connected to PostgreSQL!"})
@@ -341,7 +345,7 @@ def chat():
         
         # Gemini API call
         gemini_response = requests.post(
-            f"https://generativelanguage.googleapis.com/v1beta/models/gemini-1.5-flash:generateContent?key={api_key}",
+            f"{GEMINI_API_URL}/v1beta/models/gemini-1.5-flash:generateContent?key={api_key}",
             json={
                 "contents": [{
                     "parts": [{
@@ -594,7 +598,7 @@ def speak_with_elevenlabs(text):
         print("Warning: ELEVENLABS_API_KEY not set in environment")
         return None
     
-    url = f"https://api.elevenlabs.io/v1/text-to-speech/{VOICE_ID}"
+    url = f"{ELEVENLABS_API_URL}/v1/text-to-speech/{VOICE_ID}"
     
     headers = {
         "xi-api-key": API_KEY,
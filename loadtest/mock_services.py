@@ -0,0 +1,83 @@
+"""
+Local stand-ins for the Gemini and ElevenLabs APIs.
+
+Serves the two endpoints the backend calls so load tests run fully offline.
+Each response is delayed by a configurable latency (base + random jitter)
+to mimic the real services.
+
+Environment variables:
+    GEMINI_LATENCY_MS        base latency for generateContent (default 800)
+    GEMINI_JITTER_MS         random extra latency for generateContent (default 400)
+    ELEVENLABS_LATENCY_MS    base latency for text-to-speech (default 1200)
+    ELEVENLABS_JITTER_MS     random extra latency for text-to-speech (default 600)
+    MOCK_ERROR_RATE          fraction of requests answered with HTTP 503 (default 0)
+"""
+import os
+import random
+import time
+
+from flask import Flask, Response, jsonify, request
+
+
+app = Flask(__name__)
+
+GEMINI_LATENCY_MS = float(os.getenv("GEMINI_LATENCY_MS", "800"))
+GEMINI_JITTER_MS = float(os.getenv("GEMINI_JITTER_MS", "400"))
+ELEVENLABS_LATENCY_MS = float(os.getenv("ELEVENLABS_LATENCY_MS", "1200"))
+ELEVENLABS_JITTER_MS = float(os.getenv("ELEVENLABS_JITTER_MS", "600"))
+MOCK_ERROR_RATE = float(os.getenv("MOCK_ERROR_RATE", "0"))
+
+# A few seconds' worth of bytes so the backend writes a realistically sized file
+FAKE_MP3 = b"ID3" + bytes(48 * 1024)
+
+REPLIES = [
+    "Great job staying consistent! Keep your movements slow and controlled.",
+    "Some soreness is normal. Stop if the pain goes above 6/10 and rest.",
+    "Remember to warm up first and breathe steadily through each rep.",
+]
+
+
+def simulate_latency(base_ms, jitter_ms):
+    time.sleep((base_ms + random.uniform(0, jitter_ms)) / 1000.0)
+
+
+def should_fail():
+    return MOCK_ERROR_RATE > 0 and random.random() < MOCK_ERROR_RATE
+
+
+@app.route("/ping")
+def ping():
+    return {"message": "pong"}
+
+
+@app.route("/v1beta/models/<model>:generateContent", methods=["POST"])
+def gemini_generate_content(model):
+    simulate_latency(GEMINI_LATENCY_MS, GEMINI_JITTER_MS)
+    if should_fail():
+        return jsonify({"error": {"code": 503, "message": "Mock overload"}}), 503
+
+    return jsonify({
+        "candidates": [{
+            "content": {
+                "parts": [{"text": random.choice(REPLIES)}],
+                "role": "model"
+            },
+            "finishReason": "STOP"
+        }],
+        "modelVersion": model
+    })
+
+
+@app.route("/v1/text-to-speech/<voice_id>", methods=["POST"])
+def elevenlabs_text_to_speech(voice_id):
+    simulate_latency(ELEVENLABS_LATENCY_MS, ELEVENLABS_JITTER_MS)
+    if should_fail():
+        return jsonify({"detail": {"status": "overloaded", "message": "Mock overload"}}), 503
+
+    if not request.headers.get("xi-api-key"):
+        return jsonify({"detail": {"status": "invalid_api_key"}}), 401
+    return Response(FAKE_MP3, mimetype="audio/mpeg")
+
+
+if __name__ == "__main__":
+    app.run(host="0.0.0.0", port=int(os.getenv("MOCK_PORT", "8000")), threaded=True)
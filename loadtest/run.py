@@ -0,0 +1,357 @@
+"""
+Scripted user journeys for PhysioBuddy load tests.
+
+Each virtual user repeatedly plays the app's main flow against the backend:
+    1. Dashboard open - the requests the Profile tab fires on load
+    2. Exercise       - pick a pending exercise, stream /pose frames with rep
+                        increments, then mark it complete
+                        (pose feedback is read aloud via /tts, at most
+                        once every 5 s like the app's playTTS)
+    3. Chat           - send a chatbot message
+
+At the end a report of throughput and latency percentiles per endpoint is
+printed, and optionally written as JSON. Throughput is measured over the
+steady-state window between the end of ramp-up and the deadline.
+
+Usage:
+    python run.py --base-url http://backend:5000 --users 50 --duration 300
+"""
+import argparse
+import glob
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+
+import requests
+
+
+# Matches playTTS(minIntervalMs=5000) in Physiobuddy/utils/tts.tsx
+TTS_MIN_INTERVAL_SECONDS = 5.0
+
+CHAT_MESSAGES = [
+    "My knee feels stiff this morning, should I still exercise?",
+    "How do I know if I'm doing the squat correctly?",
+    "Is it normal to feel sore the day after?",
+    "Can I do extra sets if I feel good?",
+]
+
+
+class Stats:
+    """Thread-safe collection of per-endpoint request samples"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.samples = {}
+
+    def record(self, name, started_at, elapsed_ms, ok):
+        with self.lock:
+            self.samples.setdefault(name, []).append((started_at, elapsed_ms, ok))
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def build_report(stats, wall_seconds, window_start, window_end, warnings):
+    """Latency percentiles cover every request; RPS only those started inside the window"""
+    window_seconds = window_end - window_start
+    rows = []
+    for name in sorted(stats.samples):
+        samples = stats.samples[name]
+        values = sorted(elapsed_ms for _, elapsed_ms, _ in samples)
+        in_window = sum(1 for started_at, _, _ in samples if window_start <= started_at < window_end)
+        rows.append({
+            "endpoint": name,
+            "requests": len(values),
+            "errors": sum(1 for _, _, ok in samples if not ok),
+            "rps": round(in_window / window_seconds, 2),
+            "p50_ms": round(percentile(values, 50), 1),
+            "p90_ms": round(percentile(values, 90), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "p99_ms": round(percentile(values, 99), 1),
+            "max_ms": round(values[-1], 1),
+        })
+    return {
+        "duration_s": round(wall_seconds, 1),
+        "steady_window_s": round(window_seconds, 1),
+        "warnings": warnings,
+        "endpoints": rows,
+    }
+
+
+def print_report(report):
+    header = f"{'Endpoint':<52} {'Reqs':>7} {'Errs':>6} {'RPS':>8} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'max':>8}"
+    print(f"\nLoad test finished in {report['duration_s']}s "
+          f"(RPS over the {report['steady_window_s']}s steady-state window, latencies in ms)")
+    print(header)
+    print("-" * len(header))
+    for row in report["endpoints"]:
+        print(f"{row['endpoint']:<52} {row['requests']:>7} {row['errors']:>6} {row['rps']:>8} "
+              f"{row['p50_ms']:>8} {row['p90_ms']:>8} {row['p95_ms']:>8} {row['p99_ms']:>8} {row['max_ms']:>8}")
+    for warning in report["warnings"]:
+        print(f"\nWARNING: {warning}")
+
+
+def load_frames(frames_dir, count):
+    """Read recorded JPEG frames, or synthesise placeholder ones
+
+    Returns the frames and whether they are synthetic.
+    """
+    if frames_dir:
+        paths = sorted(glob.glob(os.path.join(frames_dir, "*.jpg")))
+        if not paths:
+            sys.exit(f"No .jpg frames found in {frames_dir}")
+        frames = []
+        for path in paths:
+            with open(path, "rb") as f:
+                frames.append(f.read())
+        return frames, False
+
+    # Noise frames still go through decode + MediaPipe, they just won't detect a pose
+    import cv2
+    import numpy as np
+    rng = np.random.default_rng(0)
+    frames = []
+    for _ in range(count):
+        image = rng.integers(0, 255, (480, 640, 3), dtype=np.uint8)
+        ok, encoded = cv2.imencode(".jpg", image)
+        if not ok:
+            sys.exit("Failed to encode synthetic /pose frame")
+        frames.append(encoded.tobytes())
+    return frames, True
+
+
+def max_patient_id(database_url):
+    import psycopg2
+    conn = psycopg2.connect(database_url)
+    with conn.cursor() as cur:
+        cur.execute("SELECT MAX(id) FROM patients")
+        result = cur.fetchone()[0]
+    conn.close()
+    return result or 0
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, user_no, args, stats, frames, stop_at):
+        super().__init__(daemon=True)
+        self.args = args
+        self.stats = stats
+        self.frames = frames
+        self.stop_at = stop_at
+        self.rng = random.Random(args.seed + user_no)
+        # One HTTP session per user so /pose keeps its Flask session cookie
+        self.http = requests.Session()
+        self.last_feedback = None
+        self.last_tts_at = 0.0
+
+    def stopped(self):
+        return time.time() >= self.stop_at
+
+    def sleep(self, seconds):
+        """Sleep, but never past the deadline"""
+        time.sleep(max(0.0, min(seconds, self.stop_at - time.time())))
+
+    def call(self, method, name, path, soft_error_name=None, **kwargs):
+        """Send a request and record its latency
+
+        When soft_error_name is given, 2xx responses whose JSON body carries an
+        "error" key are recorded under that name instead.
+        """
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            response = self.http.request(method, self.args.base_url + path,
+                                         timeout=self.args.timeout, **kwargs)
+            ok = response.status_code < 400
+        except requests.RequestException:
+            response, ok = None, False
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        if ok and soft_error_name and "error" in json_body(response):
+            name = soft_error_name
+        self.stats.record(name, started_at, elapsed_ms, ok)
+        return response
+
+    def think(self):
+        if self.args.think_time > 0:
+            self.sleep(self.rng.uniform(0, 2 * self.args.think_time))
+
+    def dashboard(self, patient_id):
+        if self.args.patient_list:
+            self.call("GET", "GET /patients", "/patients")
+        self.call("GET", "GET /patients/{id}", f"/patients/{patient_id}")
+        self.call("GET", "GET /patients/{id}/pain-reports", f"/patients/{patient_id}/pain-reports")
+        self.call("GET", "GET /patients/{id}/progress", f"/patients/{patient_id}/progress")
+        response = self.call("GET", "GET /patients/{id}/exercises/today", f"/patients/{patient_id}/exercises/today")
+        self.call("GET", "GET /patients/{id}/appointments", f"/patients/{patient_id}/appointments")
+        body = json_body(response, default=[])
+        return body if isinstance(body, list) else []
+
+    def exercise(self, patient_id, exercises):
+        pending = [e for e in exercises if e.get("status") == "pending"] or exercises
+        if not pending:
+            return
+        exercise_id = self.rng.choice(pending)["id"]
+        reps_path = f"/patients/{patient_id}/exercises/{exercise_id}/reps"
+
+        self.call("GET", "GET /patients/{id}/exercises/{id}/reps", reps_path)
+        self.call("POST", "POST /reset_pose_session", "/reset_pose_session")
+        # Frames go out on a fixed clock like the app's camera interval
+        next_frame_at = time.time()
+        for n in range(self.args.frames_per_exercise):
+            self.sleep(next_frame_at - time.time())
+            if self.stopped():
+                return
+            next_frame_at += 1.0 / self.args.fps
+            frame = self.frames[n % len(self.frames)]
+            response = self.call("POST", "POST /pose", "/pose", soft_error_name="POST /pose (no pose)",
+                                 files={"image": ("frame.jpg", frame, "image/jpeg")})
+            self.speak_feedback(json_body(response))
+            if (n + 1) % self.args.frames_per_rep == 0:
+                self.call("POST", "POST /patients/{id}/exercises/{id}/reps", reps_path,
+                          json={"action": "increment"})
+        if self.args.complete_exercise:
+            self.call("POST", "POST /patients/{id}/exercises/{id}/complete",
+                      f"/patients/{patient_id}/exercises/{exercise_id}/complete")
+
+    def speak_feedback(self, pose_result):
+        """Mirror the app: read new pose feedback aloud, at most once per interval"""
+        feedback = pose_result.get("feedback")
+        if not self.args.tts or not feedback or pose_result.get("error"):
+            return
+        if feedback == self.last_feedback:
+            return
+        self.last_feedback = feedback
+        if time.time() - self.last_tts_at < TTS_MIN_INTERVAL_SECONDS:
+            return
+        response = self.call("POST", "POST /tts", "/tts", json={"text": feedback})
+        if response is not None and response.ok:
+            self.last_tts_at = time.time()
+
+    def chat(self, patient_id):
+        self.call("POST", "POST /chat", "/chat",
+                  json={"message": self.rng.choice(CHAT_MESSAGES), "patient_id": patient_id})
+
+    def run(self):
+        while not self.stopped():
+            patient_id = self.rng.randint(1, self.args.max_patient_id)
+            exercises = self.dashboard(patient_id)
+            self.think()
+            if self.stopped():
+                break
+            self.exercise(patient_id, exercises)
+            self.think()
+            if self.stopped():
+                break
+            self.chat(patient_id)
+            self.think()
+
+
+def json_body(response, default=None):
+    """Decoded JSON body of a response, or default ({} if not given)"""
+    default = {} if default is None else default
+    if response is None or "json" not in response.headers.get("Content-Type", ""):
+        return default
+    try:
+        return response.json()
+    except ValueError:
+        return default
+
+
+def positive_float(value):
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def positive_int(value):
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run scripted PhysioBuddy user journeys and report latencies")
+    parser.add_argument("--base-url", default=os.getenv("LOADTEST_BASE_URL", "http://backend:5000"),
+                        help="Backend URL (defaults to $LOADTEST_BASE_URL or http://backend:5000)")
+    parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+    parser.add_argument("--duration", type=float, default=300, help="Test duration in seconds, including ramp-up")
+    parser.add_argument("--ramp-up", type=float, default=10, help="Seconds over which users are started")
+    parser.add_argument("--max-patient-id", type=int,
+                        help="Highest patient id to pick from (queried from $DATABASE_URL if omitted)")
+    parser.add_argument("--frames-dir", help="Directory of recorded .jpg frames to send to /pose")
+    parser.add_argument("--frames-per-exercise", type=int, default=30, help="/pose frames sent per exercise")
+    parser.add_argument("--frames-per-rep", type=positive_int, default=10, help="Frames between rep increments")
+    parser.add_argument("--fps", type=positive_float, default=0.5,
+                        help="Frames per second each user sends to /pose (the app sends one every 2 s)")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Mean pause between journey steps (s)")
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout (s)")
+    parser.add_argument("--no-patient-list", dest="patient_list", action="store_false",
+                        help="Skip GET /patients when opening the dashboard")
+    parser.add_argument("--no-complete", dest="complete_exercise", action="store_false",
+                        help="Do not mark exercises complete at the end of the journey")
+    parser.add_argument("--no-tts", dest="tts", action="store_false",
+                        help="Skip POST /tts for pose feedback during the exercise")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for journey choices")
+    parser.add_argument("--report-json", help="Write the report as JSON to this path")
+    args = parser.parse_args()
+
+    if args.max_patient_id is None:
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            sys.exit("Pass --max-patient-id or set DATABASE_URL")
+        args.max_patient_id = max_patient_id(database_url)
+    if args.max_patient_id < 1:
+        sys.exit("No patients found - run seed.py first")
+
+    frames, synthetic_frames = load_frames(args.frames_dir, 10)
+    warnings = []
+    if synthetic_frames:
+        warnings.append("No --frames-dir given: /pose received noise frames, so no pose was detected and "
+                        "landmark extraction, angle maths and rep counting were not exercised.")
+    stats = Stats()
+    started = time.time()
+    stop_at = started + args.duration
+    # Throughput is measured after every user has started; fall back to the
+    # whole run if the ramp-up covers the full duration
+    ramp_end = started + args.ramp_up
+    if ramp_end >= stop_at:
+        ramp_end = started
+        warnings.append("--ramp-up is not shorter than --duration: RPS includes the ramp-up.")
+    exercise_seconds = args.frames_per_exercise / args.fps
+    if stop_at - ramp_end < exercise_seconds:
+        warnings.append(f"The steady-state window ({stop_at - ramp_end:.0f}s) is shorter than one exercise "
+                        f"({exercise_seconds:.0f}s at --fps {args.fps:g}): users will not reach the chat step "
+                        f"or reopen the dashboard inside it. Raise --duration or lower --frames-per-exercise.")
+
+    print(f"Starting {args.users} users against {args.base_url} for {args.duration:.0f}s "
+          f"(patients 1-{args.max_patient_id})")
+    users = []
+    for n in range(args.users):
+        user = VirtualUser(n, args, stats, frames, stop_at)
+        user.start()
+        users.append(user)
+        if args.users > 1:
+            time.sleep(args.ramp_up / args.users)
+    for user in users:
+        user.join()
+
+    report = build_report(stats, time.time() - started, ramp_end, stop_at, warnings)
+    print_report(report)
+    if args.report_json:
+        with open(args.report_json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport written to {args.report_json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""
+Synthetic data generator for PhysioBuddy load tests.
+
+Seeds patients and their full history (medical info, treatment plans,
+exercise assignments, sessions, rep tracking, pain reports, reflections,
+weekly progress, chat messages, appointments and clinical notes) at a
+configurable scale. Rows are streamed into PostgreSQL with COPY in
+per-patient batches so memory stays flat even at 100k+ patients.
+
+Usage:
+    python seed.py --patients 100000 --days 730
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import psycopg2
+
+
+FIRST_NAMES = ["John", "Maria", "David", "Lisa", "James", "Aisha", "Wei", "Priya",
+               "Carlos", "Emma", "Noah", "Olivia", "Liam", "Sofia", "Ethan", "Mei",
+               "Omar", "Hannah", "Lucas", "Chloe"]
+LAST_NAMES = ["Smith", "Garcia", "Wilson", "Brown", "Taylor", "Tan", "Lim", "Kumar",
+              "Nguyen", "Lee", "Martin", "Lopez", "Clark", "Lewis", "Walker", "Hall"]
+SPECIALIZATIONS = ["Sports Injury", "Orthopedic", "Neurological", "Geriatric",
+                   "Pediatric", "Manual Therapy"]
+
+# Injury type -> (pain location, body parts it is treated with)
+INJURIES = {
+    "ACL Tear": ("knee", ["knee", "hip"]),
+    "Lower Back Strain": ("lower back", ["back", "hip"]),
+    "Rotator Cuff Injury": ("shoulder", ["shoulder"]),
+    "Ankle Sprain": ("ankle", ["ankle", "calf"]),
+    "Tennis Elbow": ("elbow", ["elbow", "shoulder"]),
+}
+RECOVERY_PHASES = ["acute", "subacute", "chronic", "maintenance"]
+
+PAIN_NOTES = ["Mild pain after exercises", "Improving, less stiffness", "Stiff in the morning",
+              "Good day, minimal discomfort", "Sharp pain after sitting", "Exercises helping"]
+REFLECTIONS = ["Feeling optimistic about recovery progress", "Pain is challenging but manageable",
+               "Mobility improving slowly", "Tired today, kept it light"]
+SESSION_NOTES = ["Completed via app", "Good strength today", "Feeling stronger",
+                 "Pain limited movement", "Perfect form today"]
+PATIENT_MESSAGES = ["Should I continue if the pain increases?", "My joint feels stiff today.",
+                    "How many sets should I do?", "Is some soreness after exercise normal?"]
+BOT_MESSAGES = ["Stop if pain exceeds 6/10 and try gentle stretches instead.",
+                "Some soreness is normal. Keep the movements slow and controlled.",
+                "Great work staying consistent with your exercises!"]
+
+# Tables written by this script, in FK-safe order
+TABLES = [
+    "physiotherapists", "patients", "medical_information", "treatment_plans",
+    "patient_exercise_assignments", "exercise_sessions", "exercise_rep_tracking",
+    "daily_pain_reports", "daily_reflections", "weekly_progress", "chat_messages",
+    "appointments", "clinical_notes",
+]
+
+COLUMNS = {
+    "physiotherapists": ["id", "first_name", "last_name", "license_no", "specializations", "email"],
+    "patients": ["id", "first_name", "last_name", "email", "age", "created_at"],
+    "medical_information": ["id", "patient_id", "physiotherapist_id", "injury_type",
+                            "recovery_phase", "special_notes"],
+    "treatment_plans": ["id", "patient_id", "physiotherapist_id", "workouts_per_week", "goals",
+                        "start_date", "end_date", "is_active"],
+    "patient_exercise_assignments": ["id", "patient_id", "exercise_id", "assigned_by",
+                                     "assigned_date", "sets_assigned", "reps_assigned"],
+    "exercise_sessions": ["id", "patient_id", "exercise_id", "assignment_id", "session_date",
+                          "sets_completed", "reps_completed", "pain_rating", "notes", "completed_at"],
+    "exercise_rep_tracking": ["id", "session_id", "patient_id", "exercise_id", "current_reps",
+                              "target_reps", "current_set", "target_sets", "is_active"],
+    "daily_pain_reports": ["id", "patient_id", "report_date", "pain_scale", "pain_location", "notes"],
+    "daily_reflections": ["id", "patient_id", "reflection_date", "reflection_text",
+                          "mood_rating", "energy_level"],
+    "weekly_progress": ["id", "patient_id", "week_start_date", "completion_percentage",
+                        "exercises_completed", "exercises_planned", "notes"],
+    "chat_messages": ["id", "patient_id", "sender_type", "sender_id", "content",
+                      "message_type", "timestamp"],
+    "appointments": ["id", "patient_id", "physiotherapist_id", "appointment_date",
+                     "appointment_time", "status", "notes"],
+    "clinical_notes": ["id", "patient_id", "physiotherapist_id", "assessment",
+                       "treatment_provided", "notes"],
+}
+
+
+def copy_value(value):
+    """Format a value for COPY text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (list, tuple)):
+        return "{" + ",".join('"%s"' % v for v in value) + "}"
+    return str(value).replace("\\", "\\\\").replace("\t", " ").replace("\n", " ")
+
+
+class Batch:
+    """Buffers rows per table and flushes them to PostgreSQL with COPY"""
+
+    def __init__(self, conn, next_ids):
+        self.conn = conn
+        self.next_ids = next_ids
+        self.buffers = {table: io.StringIO() for table in TABLES}
+        self.counts = {table: 0 for table in TABLES}
+
+    def add(self, table, *values):
+        row_id = self.next_ids[table]
+        self.next_ids[table] += 1
+        self.buffers[table].write("\t".join(copy_value(v) for v in (row_id,) + values) + "\n")
+        self.counts[table] += 1
+        return row_id
+
+    def flush(self):
+        with self.conn.cursor() as cur:
+            for table in TABLES:
+                buffer = self.buffers[table]
+                if buffer.tell() == 0:
+                    continue
+                buffer.seek(0)
+                cur.copy_from(buffer, table, columns=COLUMNS[table])
+                self.buffers[table] = io.StringIO()
+        self.conn.commit()
+
+
+def next_ids(conn):
+    ids = {}
+    with conn.cursor() as cur:
+        for table in TABLES:
+            cur.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}")
+            ids[table] = cur.fetchone()[0]
+    return ids
+
+
+def reset_sequences(conn):
+    with conn.cursor() as cur:
+        for table in TABLES:
+            cur.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+            )
+    conn.commit()
+
+
+def load_exercises(conn):
+    """Group the exercise catalogue from init.sql by body part"""
+    by_part = {}
+    with conn.cursor() as cur:
+        cur.execute("SELECT id, body_part FROM exercises ORDER BY id")
+        for exercise_id, body_part in cur.fetchall():
+            by_part.setdefault(body_part, []).append(exercise_id)
+    if not by_part:
+        sys.exit("No exercises found - run db/init.sql first")
+    return by_part
+
+
+def seed_physiotherapists(conn, rng, count):
+    batch = Batch(conn, next_ids(conn))
+    ids = []
+    for _ in range(count):
+        row_id = batch.next_ids["physiotherapists"]
+        ids.append(batch.add(
+            "physiotherapists",
+            "Dr. " + rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+            f"LT{row_id:07d}", rng.sample(SPECIALIZATIONS, 2),
+            f"loadtest.physio{row_id}@physiobuddy.com",
+        ))
+    batch.flush()
+    return ids
+
+
+def seed_patient(batch, rng, args, today, physio_ids, exercises_by_part):
+    history_start = today - timedelta(days=args.days)
+    patient_id = batch.next_ids["patients"]
+    batch.add(
+        "patients",
+        rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES),
+        f"loadtest.patient{patient_id}@email.com", rng.randint(18, 85),
+        datetime.combine(history_start, datetime.min.time()),
+    )
+
+    physio_id = rng.choice(physio_ids)
+    injury = rng.choice(list(INJURIES))
+    pain_location, body_parts = INJURIES[injury]
+    batch.add("medical_information", patient_id, physio_id, injury,
+              rng.choice(RECOVERY_PHASES), "Synthetic load-test patient")
+
+    workouts_per_week = rng.randint(2, 5)
+    batch.add("treatment_plans", patient_id, physio_id, workouts_per_week,
+              f"Recover from {injury.lower()}", history_start,
+              today + timedelta(days=rng.randint(30, 180)), True)
+
+    # Exercise assignments, each with an active rep tracker for today
+    pool = [e for part in body_parts for e in exercises_by_part.get(part, [])]
+    pool = pool or [e for ids in exercises_by_part.values() for e in ids]
+    assignments = []
+    for exercise_id in rng.sample(pool, min(len(pool), rng.randint(3, 5))):
+        sets, reps = rng.randint(2, 3), rng.choice([8, 10, 12, 15])
+        assignment_id = batch.add("patient_exercise_assignments", patient_id, exercise_id,
+                                  physio_id, history_start, sets, reps)
+        assignments.append((assignment_id, exercise_id, sets, reps))
+
+    # Day-by-day history up to (but not including) today so exercises stay pending
+    pain = rng.randint(4, 8)
+    week_start = history_start - timedelta(days=history_start.weekday())
+    week_done = 0
+    for offset in range(args.days):
+        day = history_start + timedelta(days=offset)
+        if day.weekday() == 0 and offset > 0:
+            planned = workouts_per_week * len(assignments)
+            batch.add("weekly_progress", patient_id, week_start,
+                      round(min(100.0, 100.0 * week_done / planned), 2), week_done, planned, None)
+            week_start, week_done = day, 0
+
+        if rng.random() < workouts_per_week / 7.0:
+            for assignment_id, exercise_id, sets, reps in assignments:
+                if rng.random() < 0.8:
+                    batch.add("exercise_sessions", patient_id, exercise_id, assignment_id, day,
+                              sets, reps, min(10, max(0, pain + rng.randint(-2, 1))),
+                              rng.choice(SESSION_NOTES),
+                              datetime.combine(day, datetime.min.time()) + timedelta(hours=rng.randint(7, 21)))
+                    week_done += 1
+
+        if rng.random() < args.pain_report_rate:
+            pain = min(10, max(0, pain + rng.choice([-1, -1, 0, 0, 1])))
+            batch.add("daily_pain_reports", patient_id, day, pain, pain_location, rng.choice(PAIN_NOTES))
+
+        if rng.random() < args.reflection_rate:
+            batch.add("daily_reflections", patient_id, day, rng.choice(REFLECTIONS),
+                      rng.randint(1, 5), rng.randint(1, 5))
+
+        if rng.random() < args.chats_per_week / 7.0:
+            sent_at = datetime.combine(day, datetime.min.time()) + timedelta(minutes=rng.randint(420, 1320))
+            batch.add("chat_messages", patient_id, "patient", patient_id,
+                      rng.choice(PATIENT_MESSAGES), "text", sent_at)
+            batch.add("chat_messages", patient_id, "bot", None,
+                      rng.choice(BOT_MESSAGES), "text", sent_at + timedelta(seconds=3))
+
+    # Current (partial) week so the dashboard has something to show
+    planned = workouts_per_week * len(assignments)
+    batch.add("weekly_progress", patient_id, week_start,
+              round(min(100.0, 100.0 * week_done / planned), 2), week_done, planned, None)
+
+    for assignment_id, exercise_id, sets, reps in assignments:
+        batch.add("exercise_rep_tracking", None, patient_id, exercise_id, 0, reps, 1, sets, True)
+
+    # Monthly appointments across the history plus one upcoming
+    for offset in range(0, args.days, 30):
+        day = history_start + timedelta(days=offset)
+        batch.add("appointments", patient_id, physio_id, day, f"{rng.randint(8, 17):02d}:00",
+                  rng.choice(["completed", "completed", "completed", "cancelled", "no_show"]),
+                  "Follow-up assessment")
+        if rng.random() < 0.5:
+            batch.add("clinical_notes", patient_id, physio_id, f"Pain {pain}/10, range improving.",
+                      "Exercise progression", "Synthetic load-test note")
+    batch.add("appointments", patient_id, physio_id, today + timedelta(days=rng.randint(1, 14)),
+              f"{rng.randint(8, 17):02d}:{rng.choice(['00', '30'])}", "scheduled", "Follow-up assessment")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed PhysioBuddy with synthetic load-test data")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"),
+                        help="PostgreSQL URL (defaults to $DATABASE_URL)")
+    parser.add_argument("--patients", type=int, default=1000, help="Number of patients to create")
+    parser.add_argument("--physiotherapists", type=int, default=50, help="Number of physiotherapists to create")
+    parser.add_argument("--days", type=int, default=365, help="Days of history per patient")
+    parser.add_argument("--pain-report-rate", type=float, default=0.6,
+                        help="Probability a patient files a pain report on a given day")
+    parser.add_argument("--reflection-rate", type=float, default=0.2,
+                        help="Probability a patient writes a reflection on a given day")
+    parser.add_argument("--chats-per-week", type=float, default=1.0,
+                        help="Average chat exchanges per patient per week")
+    parser.add_argument("--batch-size", type=int, default=200, help="Patients per COPY batch")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducible data")
+    parser.add_argument("--reset", action="store_true",
+                        help="Truncate all patient data and physiotherapists before seeding")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        sys.exit("No database URL given - set DATABASE_URL or pass --database-url")
+
+    rng = random.Random(args.seed)
+    today = date.today()
+    conn = psycopg2.connect(args.database_url)
+
+    if args.reset:
+        with conn.cursor() as cur:
+            cur.execute("TRUNCATE patients, physiotherapists RESTART IDENTITY CASCADE")
+        conn.commit()
+        print("Truncated existing patient data")
+
+    exercises_by_part = load_exercises(conn)
+    physio_ids = seed_physiotherapists(conn, rng, args.physiotherapists)
+
+    started = time.time()
+    batch = Batch(conn, next_ids(conn))
+    for n in range(1, args.patients + 1):
+        seed_patient(batch, rng, args, today, physio_ids, exercises_by_part)
+        if n % args.batch_size == 0 or n == args.patients:
+            batch.flush()
+            elapsed = time.time() - started
+            print(f"Seeded {n}/{args.patients} patients ({n / elapsed:.0f} patients/s)")
+
+    reset_sequences(conn)
+    with conn.cursor() as cur:
+        cur.execute("ANALYZE")
+    conn.commit()
+    conn.close()
+
+    print("Rows inserted:")
+    for table in TABLES:
+        count = batch.counts[table] if table != "physiotherapists" else len(physio_ids)
+        print(f"  {table:<30} {count:>12,}")
+
+
+if __name__ == "__main__":
+    main()